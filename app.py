@@ -88,15 +88,19 @@ if "result" in st.session_state:
         st.subheader("Stock Market Assumptions & Impact")
         col_a, col_b = st.columns([1, 2])
         with col_a:
-            st.markdown(f"- Index change: **{stock_info['index_change_pct']}%**")
-            st.markdown(f"- Volatility: **{stock_info['volatility']}**")
+            st.markdown(
+                f"- Index change: **{stock_info['index_change_pct']}%**\n"
+                f"- Volatility: **{stock_info['volatility']}**"
+            )
         with col_b:
-            st.markdown("**Impact summary:**")
-            st.markdown(f"- Market shock index: **{stock_info['market_shock']}**")
-            st.markdown(f"- Margin down adjustment applied: **{stock_info['add_margin_down']:+.4f}**")
-            st.markdown(f"- Capex inflation adjustment applied: **{stock_info['add_capex_inflation']:+.4f}**")
-            st.markdown(f"- Confidence penalty applied: **{stock_info['confidence_penalty']} pts**")
-            st.markdown(f"- Reason: {stock_info['reason']}")
+            st.markdown(
+                "**Impact summary:**\n\n"
+                f"- Market shock index: **{stock_info['market_shock']}**\n"
+                f"- Margin down adjustment applied: **{stock_info['add_margin_down']:+.4f}**\n"
+                f"- Capex inflation adjustment applied: **{stock_info['add_capex_inflation']:+.4f}**\n"
+                f"- Confidence penalty applied: **{stock_info['confidence_penalty']} pts**\n"
+                f"- Reason: {stock_info['reason']}"
+            )
 
         st.divider()
 
@@ -104,13 +108,15 @@ if "result" in st.session_state:
     st.subheader("Key Recommendations")
     for i, step in enumerate(rec["key_recommendations"], start=1):
         with st.expander(f"{i}. {step['step']}"):
-            st.markdown(f"**Owner:** {step['owner']}")
-            st.markdown(f"**Estimated duration:** {step['duration_months']} months")
-            st.markdown("**Details:**")
-            for d in step.get("details", []):
-                st.markdown(f"- {d}")
+            details_md = "\n".join(f"- {d}" for d in step.get("details", []))
+            step_md = (
+                f"**Owner:** {step['owner']}  \n"
+                f"**Estimated duration:** {step['duration_months']} months\n\n"
+                f"**Details:**\n\n{details_md}"
+            )
             if step.get("plants_in_scope"):
-                st.markdown("**Plants in scope:** " + ", ".join(step["plants_in_scope"]))
+                step_md += "\n\n**Plants in scope:** " + ", ".join(step["plants_in_scope"])
+            st.markdown(step_md)
 
     st.divider()
 
@@ -118,32 +124,28 @@ if "result" in st.session_state:
     st.subheader("Per-Plant Upgrade Specifications")
     for p in rec["per_plant_upgrades"]:
         with st.expander(f"{p['plant_name']} — add {p['added_mtpa']} MTPA"):
-            st.markdown(f"**Current capacity:** {p['current_capacity_tpa']:,} tpa")
-            st.markdown(f"**Added capacity:** {p['added_tpa']:,} tpa")
-            st.markdown(f"**Total CAPEX:** ${p['capex_total_usd']:,}")
-            st.markdown(f"**Estimated payback:** {p['estimated_payback_months']} months")
-
-            st.markdown("**Hiring estimate:**")
             hires = p.get("hiring_estimate", {})
-            st.markdown(f"- Engineers: {hires.get('engineers', 0)}  ")
-            st.markdown(f"- Maintenance: {hires.get('maintenance', 0)}  ")
-            st.markdown(f"- Operators: {hires.get('operators', 0)}  ")
-            st.markdown(f"- Project managers: {hires.get('project_managers', 0)}  ")
-
-            st.markdown("**Upgrade scope:**")
-            for u in p.get("upgrade_scope", []):
-                st.markdown(f"- {u}")
-
-            st.markdown("**CAPEX breakdown:**")
-            for k, v in p.get("capex_breakdown_usd", {}).items():
-                st.markdown(f"- {k}: ${v:,}")
-
-            st.markdown("**Schedule (months):**")
             sched = p.get("schedule_months", {})
-            st.markdown(f"- Procurement: {sched.get('procurement_months','—')} months  ")
-            st.markdown(f"- Implementation: {sched.get('implementation_months','—')} months  ")
-            st.markdown(f"- Commissioning: {sched.get('commissioning_months','—')} months  ")
-            st.markdown(f"- Expected online: {sched.get('expected_time_to_online_months','—')} months  ")
+            scope_md = "\n".join(f"- {u}" for u in p.get("upgrade_scope", []))
+            capex_md = "\n".join(f"- {k}: ${v:,}" for k, v in p.get("capex_breakdown_usd", {}).items())
+            st.markdown(
+                f"**Current capacity:** {p['current_capacity_tpa']:,} tpa  \n"
+                f"**Added capacity:** {p['added_tpa']:,} tpa  \n"
+                f"**Total CAPEX:** ${p['capex_total_usd']:,}  \n"
+                f"**Estimated payback:** {p['estimated_payback_months']} months\n\n"
+                "**Hiring estimate:**\n\n"
+                f"- Engineers: {hires.get('engineers', 0)}\n"
+                f"- Maintenance: {hires.get('maintenance', 0)}\n"
+                f"- Operators: {hires.get('operators', 0)}\n"
+                f"- Project managers: {hires.get('project_managers', 0)}\n\n"
+                f"**Upgrade scope:**\n\n{scope_md}\n\n"
+                f"**CAPEX breakdown:**\n\n{capex_md}\n\n"
+                "**Schedule (months):**\n\n"
+                f"- Procurement: {sched.get('procurement_months','—')} months\n"
+                f"- Implementation: {sched.get('implementation_months','—')} months\n"
+                f"- Commissioning: {sched.get('commissioning_months','—')} months\n"
+                f"- Expected online: {sched.get('expected_time_to_online_months','—')} months"
+            )
 
     st.divider()
 
@@ -153,14 +155,12 @@ if "result" in st.session_state:
     if phases:
         cols = st.columns(len(phases))
         for col, ph in zip(cols, phases):
-            col.markdown(f"**{ph['phase']}**")
-            col.markdown(f"Duration: {ph['months']} months")
+            col.markdown(f"**{ph['phase']}**  \nDuration: {ph['months']} months")
 
     st.divider()
 
     # Decision rationale
     st.subheader("Decision Rationale — explanation for every recommendation")
-    for b in rationale.get("bullets", []):
-        st.markdown(f"- {b}")
+    st.markdown("\n".join(f"- {b}" for b in rationale.get("bullets", [])))
 
     st.success("Complete recommendation and roadmap generated.")
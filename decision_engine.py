@@ -1,8 +1,9 @@
 # File: decision_engine.py
 from __future__ import annotations
 import re
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 
 OPERATIONAL_FLOW_DOC = "/mnt/data/Operational Flow.docx"
 
@@ -11,12 +12,12 @@ MARGIN_PER_TON_USD = 120
 MW_PER_MTPA = 2.5
 CARGO_TONNE_PER_STEEL_TONNE = 0.15
 
-PER_PLANT_MTPA = [
+PER_PLANT_MTPA = (
     {"id": "SP1", "name": "Steel Plant 1", "added_mtpa": 0.8},
     {"id": "SP2", "name": "Steel Plant 2", "added_mtpa": 0.6},
     {"id": "SP3", "name": "Steel Plant 3", "added_mtpa": 0.4},
     {"id": "SP4", "name": "Steel Plant 4", "added_mtpa": 0.2},
-]
+)
 
 # baseline shares
 PORT_UTILIZATION = 0.70
@@ -38,6 +39,31 @@ BASE_RISK_PROFILE = {
 START_CONFIDENCE = 88
 MIN_CONFIDENCE = 40
 
+# static result text; one roadmap phase per key recommendation step, in the same order
+ROADMAP_PHASE_NAMES = (
+    "Program setup",
+    "Phase A (ROI-first)",
+    "Phase B (remaining)",
+    "Ports & Logistics readiness",
+    "Energy readiness",
+    "Procurement & de-risking",
+    "Controls & Commissioning",
+)
+RATIONALE_BULLETS = (
+    "Phase A targets highest ROI plants to accelerate cash flow.",
+    "Modular EAF and MES deliver fastest capacity gains per USD.",
+    "Ports program ensures project shipments do not reduce commercial cargo capacity.",
+    "Energy program combines PPAs, WHR and substation upgrades to avoid drawing additional capacity from the national grid.",
+    "Procurement frame contracts and dual-sourcing mitigate long-lead and geopolitical supplier risk.",
+)
+
+# patterns used to extract baseline figures from the operational flow doc
+_RE_DOC_PORTS = re.compile(r'ports.*?(\d+[\d,]*)\s*tpa', re.I | re.S)
+_RE_DOC_ENERGY = re.compile(r'power.*?(\d+)\s*MW', re.I | re.S)
+_RE_DOC_PLANTS = tuple(
+    (i, re.compile(r'(steel plant\s*' + str(i) + r').*?(\d+[\d,]*)\s*tpa', re.I | re.S)) for i in range(1, 6)
+)
+
 DEFAULT_DATA = {
     "steel": {
         "plants": [
@@ -76,7 +102,7 @@ def _energy_mw_for_mtpa(mtpa: float) -> float:
 def _try_load_docx(path: str) -> Dict[str, Any]:
     try:
         from docx import Document
-    except Exception:
+    except ImportError:
         return {}
     try:
         p = Path(path)
@@ -85,15 +111,15 @@ def _try_load_docx(path: str) -> Dict[str, Any]:
         doc = Document(path)
         text = "\n".join(par.text for par in doc.paragraphs if par.text)
         extracted: Dict[str, Any] = {}
-        m_ports = re.search(r'ports.*?(\d+[\d,]*)\s*tpa', text, re.I | re.S)
+        m_ports = _RE_DOC_PORTS.search(text)
         if m_ports:
             extracted.setdefault("ports", {})["total_port_capacity_tpa"] = int(m_ports.group(1).replace(",", ""))
-        m_energy = re.search(r'power.*?(\d+)\s*MW', text, re.I | re.S)
+        m_energy = _RE_DOC_ENERGY.search(text)
         if m_energy:
             extracted.setdefault("energy", {})["total_energy_capacity_mw"] = int(m_energy.group(1))
         plants = []
-        for i in range(1, 6):
-            m = re.search(r'(steel plant\s*' + str(i) + r').*?(\d+[\d,]*)\s*tpa', text, re.I | re.S)
+        for i, pattern in _RE_DOC_PLANTS:
+            m = pattern.search(text)
             if m:
                 plants.append({"id": f"SP{i}", "name": m.group(1).strip(), "current_capacity_tpa": int(m.group(2).replace(",", ""))})
         if plants:
@@ -103,10 +129,25 @@ def _try_load_docx(path: str) -> Dict[str, Any]:
         return {}
 
 
-def _load_data():
+def _doc_mtime_ns(path: str) -> Optional[int]:
+    try:
+        return Path(path).stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@lru_cache(maxsize=1)
+def _load_data_for(doc_mtime_ns: Optional[int]) -> Dict[str, Any]:
+    """
+    Assemble baseline data, overriding defaults with values parsed from the operational flow doc.
+    Cached per doc modification time (None = no doc), so the docx import/parse runs once per version.
+    """
+    if doc_mtime_ns is None:
+        return _with_aggregates(DEFAULT_DATA)
     doc_values = _try_load_docx(OPERATIONAL_FLOW_DOC)
     if doc_values:
-        data = {**DEFAULT_DATA}
+        # copy each section so doc overrides never leak into the shared DEFAULT_DATA
+        data = {k: dict(v) for k, v in DEFAULT_DATA.items()}
         if "steel" in doc_values:
             data["steel"]["plants"] = doc_values["steel"].get("plants", data["steel"]["plants"])
         if "ports" in doc_values:
@@ -119,11 +160,33 @@ def _load_data():
             if tm:
                 per = int(tm // 3)
                 data["energy"]["plants"] = [{"id": f"E{i+1}", "capacity_mw": per} for i in range(3)]
-        return data
-    return DEFAULT_DATA
+        return _with_aggregates(data)
+    return _with_aggregates(DEFAULT_DATA)
 
 
-def _build_per_plant_upgrade(plant: Dict[str, Any], added_mtpa: float) -> Dict[str, Any]:
+def _with_aggregates(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return a shallow copy of data with an "_agg" entry holding the port/energy headroom,
+    which depends only on the data and so is computed once per load instead of per run.
+    """
+    ports = data.get("ports", {}).get("ports", [])
+    energy_plants = data.get("energy", {}).get("plants", [])
+    return {
+        **data,
+        "_agg": {
+            "port_headroom": _evaluate_port_headroom(ports),
+            "energy_headroom": _evaluate_energy_headroom(energy_plants),
+        },
+    }
+
+
+def _load_data() -> Dict[str, Any]:
+    """Baseline data. The returned dict is shared between calls: treat it as read-only."""
+    return _load_data_for(_doc_mtime_ns(OPERATIONAL_FLOW_DOC))
+
+
+def _build_upgrade(added_mtpa: float) -> Dict[str, Any]:
+    """Upgrade package for one plant. Depends only on added_mtpa; _simulate adds the plant identity."""
     added_tpa = int(round(added_mtpa * 1_000_000))
     capex = int(round(_capex_for_mtpa(added_mtpa)))
 
@@ -174,9 +237,6 @@ def _build_per_plant_upgrade(plant: Dict[str, Any], added_mtpa: float) -> Dict[s
     added_margin_annual = int(round(added_tpa * MARGIN_PER_TON_USD))
 
     return {
-        "plant_id": plant.get("id"),
-        "plant_name": plant.get("name"),
-        "current_capacity_tpa": int(plant.get("current_capacity_tpa", 0)),
         "added_mtpa": round(added_mtpa, 3),
         "added_tpa": added_tpa,
         "capex_total_usd": capex,
@@ -189,6 +249,52 @@ def _build_per_plant_upgrade(plant: Dict[str, Any], added_mtpa: float) -> Dict[s
     }
 
 
+def _roi_proxy(upgrade: Dict[str, Any]) -> float:
+    return upgrade["expected_annual_margin_usd"] / (upgrade["capex_total_usd"] or 1)
+
+
+# upgrades depend only on added_mtpa (not on the plant record or the risk profile), so they are
+# built once at import; _simulate's per-plant rows and every plan-level figure below come from these
+_PLAN_UPGRADES = tuple(_build_upgrade(a["added_mtpa"]) for a in PER_PLANT_MTPA)
+_PLAN_ADDED_MTPA = sum(a["added_mtpa"] for a in PER_PLANT_MTPA)
+_PLAN_ADDED_TPA = sum(u["added_tpa"] for u in _PLAN_UPGRADES)
+_PLAN_CAPEX_USD = sum(u["capex_total_usd"] for u in _PLAN_UPGRADES)
+_PLAN_MARGIN_USD = sum(u["expected_annual_margin_usd"] for u in _PLAN_UPGRADES)
+_PLAN_MAX_ONLINE_MONTHS = max(u["schedule_windows_months"]["expected_time_to_online_months"] for u in _PLAN_UPGRADES)
+_PLAN_PORT_REQUIREMENT_TPA = int(round(_PLAN_ADDED_TPA * CARGO_TONNE_PER_STEEL_TONNE))
+_PLAN_ENERGY_REQUIRED_MW = _energy_mw_for_mtpa(_PLAN_ADDED_MTPA)
+# ROI-first phase ordering (stable sort, so ties keep PER_PLANT_MTPA order)
+_ROI_ORDER = tuple(sorted(range(len(_PLAN_UPGRADES)), key=lambda i: _roi_proxy(_PLAN_UPGRADES[i]), reverse=True))
+_PHASE_A_ORDER = _ROI_ORDER[:2]
+_PHASE_B_ORDER = _ROI_ORDER[2:]
+_PHASE_A_MAX_ONLINE_MONTHS = max((_PLAN_UPGRADES[i]["schedule_windows_months"]["expected_time_to_online_months"] for i in _PHASE_A_ORDER), default=6)
+_PHASE_B_MAX_ONLINE_MONTHS = max((_PLAN_UPGRADES[i]["schedule_windows_months"]["expected_time_to_online_months"] for i in _PHASE_B_ORDER), default=0)
+
+
+def _evaluate_port_headroom(ports: List[Dict[str, Any]]) -> (int, int):
+    """
+    Ports EM view: total port capacity and the share that can be made available to the project
+    (spare capacity plus the group's own share of used throughput). Independent of the steel plan.
+    """
+    total_port_capacity = sum(int(p.get("capacity_tpa", 0)) for p in ports) or 0
+    used_port = int(round(total_port_capacity * PORT_UTILIZATION))
+    group_port_share = int(round(used_port * PORT_GROUP_SHARE_OF_USED))
+    spare_port = total_port_capacity - used_port
+    return total_port_capacity, spare_port + group_port_share
+
+
+def _evaluate_energy_headroom(energy_plants: List[Dict[str, Any]]) -> (float, float):
+    """
+    Energy EM view: total generation capacity and the MW that can be made available to the project
+    without touching national-grid commitments. Independent of the steel plan.
+    """
+    total_energy_capacity_mw = sum(float(e.get("capacity_mw", 0)) for e in energy_plants) or 0.0
+    used_energy_mw = total_energy_capacity_mw * ENERGY_UTILIZATION
+    group_energy_share_mw = used_energy_mw * (1 - ENERGY_GRID_SHARE_OF_USED)
+    spare_energy_mw = total_energy_capacity_mw - used_energy_mw
+    return total_energy_capacity_mw, spare_energy_mw + group_energy_share_mw
+
+
 def _apply_stock_market_impact(base_risks: Dict[str, float], stock_market: Optional[Dict[str, Any]]) -> (Dict[str, float], Dict[str, Any]):
     """
     If stock_market provided, return adjusted risk profile and a small impact summary dict.
@@ -205,7 +311,7 @@ def _apply_stock_market_impact(base_risks: Dict[str, float], stock_market: Optio
     try:
         idx_change = float(stock_market.get("index_change_pct", 0.0))
         vol_str = str(stock_market.get("volatility", "Medium")).lower()
-    except Exception:
+    except (TypeError, ValueError, OverflowError, AttributeError):
         return risks, impact
 
     vol_map = {"low": 0.6, "medium": 1.0, "high": 1.4}
@@ -243,164 +349,139 @@ def _apply_stock_market_impact(base_risks: Dict[str, float], stock_market: Optio
     return risks, impact
 
 
-def run_simulation(query: str, stock_market: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+def _simulate(data: Dict[str, Any], query: str, stock_market: Optional[Dict[str, Any]]) -> Dict[str, Any]:
     """
-    Main entry. Accepts optional stock_market dict to adjust risk profile.
-    Returns result dict (clean, human-readable values).
+    Run one scenario against already-loaded baseline data (see _load_data).
+    Does not mutate data, so the same data can be shared across scenarios.
     """
-    # load baseline data and risks
-    data = _load_data()
-    plants = data.get("steel", {}).get("plants", [])
-    ports = data.get("ports", {}).get("ports", [])
-    energy_plants = data.get("energy", {}).get("plants", [])
+    # _load_data guarantees every section (DEFAULT_DATA keys survive doc overrides)
+    plants = data["steel"]["plants"]
+    agg = data["_agg"]
 
-    # copy base risk and apply stock market adjustments (if any)
-    risk_profile = dict(BASE_RISK_PROFILE)
-    risk_profile, stock_impact = _apply_stock_market_impact(risk_profile, stock_market)
+    # apply stock market adjustments (if any); returns its own copy of the base risks
+    risk_profile, stock_impact = _apply_stock_market_impact(BASE_RISK_PROFILE, stock_market)
 
-    # compute per-plant upgrades
+    # per-plant upgrades: the precomputed package plus this data's plant identity (see _PLAN_*)
     per_plant_results: List[Dict[str, Any]] = []
-    total_added_mtpa = 0.0
-    total_capex = 0
-    total_added_tpa = 0
-    total_added_margin = 0
-
     for idx, assignment in enumerate(PER_PLANT_MTPA):
         plant = plants[idx] if idx < len(plants) else {"id": assignment["id"], "name": assignment["name"], "current_capacity_tpa": 0}
-        added_mtpa = assignment["added_mtpa"]
-        entry = _build_per_plant_upgrade(plant, added_mtpa)
-        per_plant_results.append(entry)
-        total_added_mtpa += added_mtpa
-        total_capex += entry["capex_total_usd"]
-        total_added_tpa += entry["added_tpa"]
-        total_added_margin += entry["expected_annual_margin_usd"]
+        per_plant_results.append({
+            "plant_id": plant.get("id"),
+            "plant_name": plant.get("name"),
+            "current_capacity_tpa": int(plant.get("current_capacity_tpa", 0)),
+            **_PLAN_UPGRADES[idx]
+        })
+    total_added_mtpa = _PLAN_ADDED_MTPA
+    total_capex = _PLAN_CAPEX_USD
+    total_added_margin = _PLAN_MARGIN_USD
 
     # ports
-    total_port_capacity = sum(int(p.get("capacity_tpa", 0)) for p in ports) or 0
-    used_port = int(round(total_port_capacity * PORT_UTILIZATION))
-    group_port_share = int(round(used_port * PORT_GROUP_SHARE_OF_USED))
-    spare_port = total_port_capacity - used_port
-    available_port_for_project = spare_port + group_port_share
-    port_requirement_tpa = int(round(total_added_tpa * CARGO_TONNE_PER_STEEL_TONNE))
+    total_port_capacity, available_port_for_project = agg["port_headroom"]
+    port_requirement_tpa = _PLAN_PORT_REQUIREMENT_TPA
 
     # energy
-    total_energy_capacity_mw = sum(float(e.get("capacity_mw", 0)) for e in energy_plants) or 0.0
-    used_energy_mw = total_energy_capacity_mw * ENERGY_UTILIZATION
-    group_energy_share_mw = used_energy_mw * (1 - ENERGY_GRID_SHARE_OF_USED)
-    spare_energy_mw = total_energy_capacity_mw - used_energy_mw
-    available_energy_for_project_mw = spare_energy_mw + group_energy_share_mw
-    energy_required_mw = _energy_mw_for_mtpa(total_added_mtpa)
+    total_energy_capacity_mw, available_energy_for_project_mw = agg["energy_headroom"]
+    energy_required_mw = _PLAN_ENERGY_REQUIRED_MW
 
     # schedule/financial adjustments from (possibly) updated risk_profile
     capex_inflation = risk_profile["capex_inflation_pct"]
+    margin_down = risk_profile["margin_down_pct"]
+    capex_factor = 1 + capex_inflation
+    margin_factor = 1 - margin_down
     schedule_procurement_pct = risk_profile["procurement_delay_pct"]
     schedule_implementation_pct = risk_profile["implementation_delay_pct"]
 
-    max_online = max(p["schedule_windows_months"]["expected_time_to_online_months"] for p in per_plant_results)
-    project_timeline_months = int(round(max_online * (1 + schedule_procurement_pct + schedule_implementation_pct * 0.25)))
+    project_timeline_months = int(round(_PLAN_MAX_ONLINE_MONTHS * (1 + schedule_procurement_pct + schedule_implementation_pct * 0.25)))
 
-    final_capex_usd = int(round(total_capex * (1 + capex_inflation)))
-    final_annual_margin_usd = int(round(total_added_margin * (1 - risk_profile["margin_down_pct"])))
+    final_capex_usd = int(round(total_capex * capex_factor))
+    final_annual_margin_usd = int(round(total_added_margin * margin_factor))
     estimated_payback_months = None
     if final_annual_margin_usd > 0:
         estimated_payback_months = round((final_capex_usd / final_annual_margin_usd) * 12.0, 1)
 
-    # recommendations (same structure as before)
-    key_recommendations: List[Dict[str, Any]] = []
-    key_recommendations.append({
-        "step": "Program setup & governance",
-        "owner": "Group PMO",
-        "duration_months": 1,
-        "details": [
-            "Establish PMO with weekly gates and KPI dashboard",
-            "Appoint SRO and plant PMs",
-            "Secure contingency funding (5-10% Phase A)"
-        ]
-    })
-
-    for p in per_plant_results:
-        p["roi_proxy"] = (p["expected_annual_margin_usd"] / (p["capex_total_usd"] or 1))
-    sorted_by_roi = sorted(per_plant_results, key=lambda x: x["roi_proxy"], reverse=True)
-    phase_a = sorted_by_roi[:2]
-    phase_b = sorted_by_roi[2:]
-
-    if phase_a:
-        phase_a_max_online = max(item["schedule_windows_months"]["expected_time_to_online_months"] for item in phase_a)
-    else:
-        phase_a_max_online = 6
-
-    key_recommendations.append({
-        "step": "Phase A execution (ROI-first)",
-        "owner": "Steel EM / Plant PMs",
-        "duration_months": max(int(round(phase_a_max_online * (1 + schedule_procurement_pct + schedule_implementation_pct * 0.2))), 6),
-        "details": [
-            "Deploy MES & automation, procure/install modular EAFs, WHR & substation upgrades",
-            "Stockyard automation and frame contracts for long-lead items",
-            "Prioritize early cash generation and quick commissioning"
-        ],
-        "plants_in_scope": [p["plant_name"] for p in phase_a]
-    })
-
-    key_recommendations.append({
-        "step": "Phase B execution (remaining plants)",
-        "owner": "Steel EM / Plant PMs",
-        "duration_months": max(6, int(round(max(p["schedule_windows_months"]["expected_time_to_online_months"] for p in phase_b) * (1 + schedule_procurement_pct)))) if phase_b else 6,
-        "details": [
-            "Repeat modular installations where required and finalize finishing upgrades",
-            "Scale supply chain flows and integrate MES dashboards",
-            "Use Phase A learnings to compress schedule"
-        ],
-        "plants_in_scope": [p["plant_name"] for p in phase_b]
-    })
-
-    key_recommendations.append({
-        "step": "Ports & logistics (protect commercial throughput)",
-        "owner": "Ports EM / Logistics",
-        "duration_months": 2,
-        "details": [
-            "Reserve temporary berth capacity & 3PL partners",
-            "Time-window inbound shipments to avoid commercial peaks",
-            "Expedited customs lanes & extra shifts during inbound peaks",
-            f"Maintain commercial throughput allocation (~{int(round(total_port_capacity * 0.7)):,} tpa) while using spare/3PL for project"
-        ]
-    })
-
-    key_recommendations.append({
-        "step": "Energy program (protect national grid supply)",
-        "owner": "Energy EM / Utilities",
-        "duration_months": 3,
-        "details": [
-            "Negotiate short-term PPAs, add WHR/captive generation",
-            "Upgrade substations/switchgear, implement smart load scheduling",
-            f"Keep national-grid commitments intact (~{int(round((1 - ENERGY_GRID_SHARE_OF_USED) * total_energy_capacity_mw))} MW prioritized)"
-        ]
-    })
-
-    key_recommendations.append({
-        "step": "Procurement & supplier de-risking",
-        "owner": "Group Procurement",
-        "duration_months": 4,
-        "details": [
-            "Sign frame contracts & partial advances for long-lead items",
-            "Dual-sourcing and vendor-managed inventory for consumables"
-        ]
-    })
-
-    key_recommendations.append({
-        "step": "Controls & commissioning",
-        "owner": "PMO",
-        "duration_months": 2,
-        "details": [
-            "Integrated commissioning plans with group-level cutovers",
-            "10% schedule contingency & 8-12% capex contingency",
-            "Acceptance gates: mechanical, cold, hot, performance"
-        ]
-    })
+    phase_a = [per_plant_results[i] for i in _PHASE_A_ORDER]
+    phase_b = [per_plant_results[i] for i in _PHASE_B_ORDER]
+
+    # recommendations (same structure as before), built in one literal
+    key_recommendations: List[Dict[str, Any]] = [
+        {
+            "step": "Program setup & governance",
+            "owner": "Group PMO",
+            "duration_months": 1,
+            "details": [
+                "Establish PMO with weekly gates and KPI dashboard",
+                "Appoint SRO and plant PMs",
+                "Secure contingency funding (5-10% Phase A)"
+            ]
+        },
+        {
+            "step": "Phase A execution (ROI-first)",
+            "owner": "Steel EM / Plant PMs",
+            "duration_months": max(int(round(_PHASE_A_MAX_ONLINE_MONTHS * (1 + schedule_procurement_pct + schedule_implementation_pct * 0.2))), 6),
+            "details": [
+                "Deploy MES & automation, procure/install modular EAFs, WHR & substation upgrades",
+                "Stockyard automation and frame contracts for long-lead items",
+                "Prioritize early cash generation and quick commissioning"
+            ],
+            "plants_in_scope": [p["plant_name"] for p in phase_a]
+        },
+        {
+            "step": "Phase B execution (remaining plants)",
+            "owner": "Steel EM / Plant PMs",
+            "duration_months": max(6, int(round(_PHASE_B_MAX_ONLINE_MONTHS * (1 + schedule_procurement_pct)))) if phase_b else 6,
+            "details": [
+                "Repeat modular installations where required and finalize finishing upgrades",
+                "Scale supply chain flows and integrate MES dashboards",
+                "Use Phase A learnings to compress schedule"
+            ],
+            "plants_in_scope": [p["plant_name"] for p in phase_b]
+        },
+        {
+            "step": "Ports & logistics (protect commercial throughput)",
+            "owner": "Ports EM / Logistics",
+            "duration_months": 2,
+            "details": [
+                "Reserve temporary berth capacity & 3PL partners",
+                "Time-window inbound shipments to avoid commercial peaks",
+                "Expedited customs lanes & extra shifts during inbound peaks",
+                f"Maintain commercial throughput allocation (~{int(round(total_port_capacity * 0.7)):,} tpa) while using spare/3PL for project"
+            ]
+        },
+        {
+            "step": "Energy program (protect national grid supply)",
+            "owner": "Energy EM / Utilities",
+            "duration_months": 3,
+            "details": [
+                "Negotiate short-term PPAs, add WHR/captive generation",
+                "Upgrade substations/switchgear, implement smart load scheduling",
+                f"Keep national-grid commitments intact (~{int(round((1 - ENERGY_GRID_SHARE_OF_USED) * total_energy_capacity_mw))} MW prioritized)"
+            ]
+        },
+        {
+            "step": "Procurement & supplier de-risking",
+            "owner": "Group Procurement",
+            "duration_months": 4,
+            "details": [
+                "Sign frame contracts & partial advances for long-lead items",
+                "Dual-sourcing and vendor-managed inventory for consumables"
+            ]
+        },
+        {
+            "step": "Controls & commissioning",
+            "owner": "PMO",
+            "duration_months": 2,
+            "details": [
+                "Integrated commissioning plans with group-level cutovers",
+                "10% schedule contingency & 8-12% capex contingency",
+                "Acceptance gates: mechanical, cold, hot, performance"
+            ]
+        }
+    ]
 
     per_plant_upgrades: List[Dict[str, Any]] = []
     for p in per_plant_results:
-        p_final_capex = int(round(p["capex_total_usd"] * (1 + risk_profile["capex_inflation_pct"])))
-        annual_margin_final = int(round(p["expected_annual_margin_usd"] * (1 - risk_profile["margin_down_pct"])))
+        p_final_capex = int(round(p["capex_total_usd"] * capex_factor))
+        annual_margin_final = int(round(p["expected_annual_margin_usd"] * margin_factor))
         payback_final = None
         if annual_margin_final > 0:
             payback_final = round((p_final_capex / annual_margin_final) * 12.0, 1)
@@ -410,11 +491,11 @@ def run_simulation(query: str, stock_market: Optional[Dict[str, Any]] = None) ->
             "current_capacity_tpa": p["current_capacity_tpa"],
             "added_mtpa": p["added_mtpa"],
             "added_tpa": p["added_tpa"],
-            "upgrade_scope": p["upgrade_scope"],
+            "upgrade_scope": list(p["upgrade_scope"]),
             "capex_total_usd": p_final_capex,
-            "capex_breakdown_usd": {k: int(round(v * (1 + risk_profile["capex_inflation_pct"]))) for k, v in p["capex_breakdown_usd"].items()},
-            "hiring_estimate": p["hiring_estimate"],
-            "schedule_months": p["schedule_windows_months"],
+            "capex_breakdown_usd": {k: int(round(v * capex_factor)) for k, v in p["capex_breakdown_usd"].items()},
+            "hiring_estimate": dict(p["hiring_estimate"]),
+            "schedule_months": dict(p["schedule_windows_months"]),
             "estimated_payback_months": payback_final
         })
 
@@ -425,8 +506,8 @@ def run_simulation(query: str, stock_market: Optional[Dict[str, Any]] = None) ->
     if port_requirement_tpa > available_port_for_project:
         confidence -= 12
     # penalty for capex inflation + margin erosion using adjusted risk_profile
-    confidence -= int(round(risk_profile["capex_inflation_pct"] * 10))
-    confidence -= int(round(risk_profile["margin_down_pct"] * 10))
+    confidence -= int(round(capex_inflation * 10))
+    confidence -= int(round(margin_down * 10))
 
     # If stock market applied, further reduce confidence from stock_impact
     if stock_impact.get("applied", False):
@@ -434,61 +515,71 @@ def run_simulation(query: str, stock_market: Optional[Dict[str, Any]] = None) ->
 
     confidence = max(confidence, MIN_CONFIDENCE)
 
+    # confidence, final_capex_usd, project_timeline_months and the port figures are already ints;
+    # only the float-valued outputs need rounding, once each
+    energy_required_mw_out = round(energy_required_mw, 2)
+
     result = {
         "recommendation": {
             "headline": f"Comprehensive recommendation to add +{total_added_mtpa:.3f} MTPA across Group X steel plants",
             "summary": "Staged program (Phase A ROI-first) with detailed per-plant upgrades and supporting ports & energy programs to ensure commercial cargo and national-grid supply remain uncompromised.",
             "metrics": {
                 "added_mtpa": round(total_added_mtpa, 3),
-                "investment_usd": int(round(final_capex_usd)),
+                "investment_usd": final_capex_usd,
                 "estimated_payback_months": estimated_payback_months,
-                "project_timeline_months": int(round(project_timeline_months)),
-                "confidence_pct": int(round(confidence)),
-                "energy_required_mw": round(energy_required_mw, 2),
-                "port_throughput_required_tpa": int(port_requirement_tpa)
+                "project_timeline_months": project_timeline_months,
+                "confidence_pct": confidence,
+                "energy_required_mw": energy_required_mw_out,
+                "port_throughput_required_tpa": port_requirement_tpa
             },
             "key_recommendations": key_recommendations,
             "per_plant_upgrades": per_plant_upgrades
         },
         "roadmap": {
             "phases": [
-                {"phase": "Program setup", "months": 1},
-                {"phase": "Phase A (ROI-first)", "months": key_recommendations[1]["duration_months"]},
-                {"phase": "Phase B (remaining)", "months": key_recommendations[2]["duration_months"]},
-                {"phase": "Ports & Logistics readiness", "months": key_recommendations[3]["duration_months"]},
-                {"phase": "Energy readiness", "months": key_recommendations[4]["duration_months"]},
-                {"phase": "Procurement & de-risking", "months": key_recommendations[5]["duration_months"]},
-                {"phase": "Controls & Commissioning", "months": key_recommendations[6]["duration_months"]},
+                {"phase": name, "months": step["duration_months"]}
+                for name, step in zip(ROADMAP_PHASE_NAMES, key_recommendations)
             ],
-            "project_timeline_months": int(round(project_timeline_months))
+            "project_timeline_months": project_timeline_months
         },
-        "rationale": {"bullets": [
-            "Phase A targets highest ROI plants to accelerate cash flow.",
-            "Modular EAF and MES deliver fastest capacity gains per USD.",
-            "Ports program ensures project shipments do not reduce commercial cargo capacity.",
-            "Energy program combines PPAs, WHR and substation upgrades to avoid drawing additional capacity from the national grid.",
-            "Procurement frame contracts and dual-sourcing mitigate long-lead and geopolitical supplier risk."
-        ]},
+        "rationale": {"bullets": list(RATIONALE_BULLETS)},
         "em_summaries": {
             "steel": per_plant_upgrades,
             "ports": {
                 "total_port_capacity_tpa": total_port_capacity,
-                "available_for_project_tpa": int(round(available_port_for_project)),
-                "required_for_project_tpa": int(round(port_requirement_tpa))
+                "available_for_project_tpa": available_port_for_project,
+                "required_for_project_tpa": port_requirement_tpa
             },
             "energy": {
                 "total_energy_capacity_mw": int(round(total_energy_capacity_mw)),
-                "available_for_project_mw": float(round(available_energy_for_project_mw, 2)),
-                "required_for_project_mw": float(round(energy_required_mw, 2))
+                "available_for_project_mw": round(available_energy_for_project_mw, 2),
+                "required_for_project_mw": energy_required_mw_out
             }
         },
         "stock_market_assumptions": stock_impact,
-        "confidence_pct": int(round(confidence))
+        "confidence_pct": confidence
     }
 
     return result
 
 
+def run_simulation(query: str, stock_market: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Main entry. Accepts optional stock_market dict to adjust risk profile.
+    Returns result dict (clean, human-readable values).
+    """
+    return _simulate(_load_data(), query, stock_market)
+
+
+def run_simulation_batch(scenarios: Sequence[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+    """
+    Run several (query, stock_market) scenarios, e.g. for side-by-side comparison.
+    Baseline data is loaded once and shared; results are in the same order as scenarios.
+    """
+    data = _load_data()
+    return [_simulate(data, query, stock_market) for query, stock_market in scenarios]
+
+
 if __name__ == "__main__":
     # quick local execution debug (not printed as raw JSON in UI)
     q = "Example: increase capacity by 2 MTPA"